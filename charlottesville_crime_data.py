@@ -1,8 +1,14 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor
+import openpyxl
+import pyarrow as pa
 from dotenv import load_dotenv
 
 # To run:
@@ -41,6 +47,102 @@ if GOOGLE_API_KEY is None or WORKING_DIR is None:
 # Data Loading with Caching & Refresh Option
 #######################################
 
+# Columns driven by the sidebar filters. They are low-cardinality strings, so
+# they are stored as pandas Categoricals: option lists come straight from the
+# category index and filtering compares small integer codes instead of strings.
+FILTER_COLS = ("neighborhood", "zip", "FullStreet", "Season", "DayOfWeek",
+               "TimeOfDay", "Agency", "Offense", "ReportingOfficer")
+
+def _categorize_filter_columns(df):
+    for col in FILTER_COLS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("string").fillna("N/A").astype("category")
+    return df
+
+def _derive_calendar_columns(df):
+    """
+    Rebuild DayOfWeek, Weekend, Season, and TimeOfDay from the Date column as
+    small-integer Categoricals instead of carrying them as strings from the
+    data file. The definitions mirror the notebook that produces the file:
+    astronomical season boundaries and the 5/12/17/21 time-of-day cutoffs.
+    Rows with a missing Date get a missing category (code -1).
+    """
+    dow_codes = df["Date"].dt.dayofweek.fillna(-1).astype("int8").to_numpy()
+    df["DayOfWeek"] = pd.Categorical.from_codes(
+        dow_codes,
+        categories=["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+    )
+    df["Weekend"] = dow_codes >= 5
+
+    month_day = (df["Date"].dt.month * 100 + df["Date"].dt.day).to_numpy(dtype="float64")
+    season_codes = np.select(
+        [
+            np.isnan(month_day),
+            (month_day >= 1221) | (month_day < 320),
+            month_day < 621,
+            month_day < 922,
+        ],
+        [-1, 0, 1, 2],
+        default=3,
+    ).astype("int8")
+    df["Season"] = pd.Categorical.from_codes(
+        season_codes, categories=["Winter", "Spring", "Summer", "Autumn"]
+    )
+
+    hour = df["Date"].dt.hour.to_numpy(dtype="float64")
+    tod_codes = np.select(
+        [
+            np.isnan(hour),
+            (hour >= 5) & (hour < 12),
+            (hour >= 12) & (hour < 17),
+            (hour >= 17) & (hour < 21),
+        ],
+        [-1, 0, 1, 2],
+        default=3,
+    ).astype("int8")
+    df["TimeOfDay"] = pd.Categorical.from_codes(
+        tod_codes, categories=["Morning", "Afternoon", "Evening", "Night"]
+    )
+    return df
+
+def _isin_codes(s, values):
+    """
+    Categorical-aware replacement for Series.isin that maps the selected
+    values to category codes once and compares integer codes row-wise.
+    """
+    codes = s.cat.categories.get_indexer(list(values))
+    return s.cat.codes.isin(codes[codes >= 0])
+
+def _unique_counts(df, col):
+    """
+    Unique-incident counts per value of `col`, assuming `df` carries one row
+    per IncidentID. A single value_counts hash pass replaces the old
+    groupby(col)["IncidentID"].nunique() double hash; categories left empty
+    by the filters are dropped so they do not appear as zero bars.
+    """
+    counts = df[col].value_counts()
+    return counts[counts > 0]
+
+def _read_xlsx_stream(path):
+    """
+    Read an xlsx file into a DataFrame using openpyxl's read-only mode.
+    Unlike the default DOM parser, this streams rows instead of building the
+    whole workbook in memory, which is dramatically faster for large sheets.
+    """
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        rows = ws.iter_rows(values_only=True)
+        headers = next(rows, None)
+        if headers is None:
+            return pd.DataFrame()
+        columns = list(zip(*rows))
+        if not columns:
+            return pd.DataFrame(columns=headers)
+        return pd.DataFrame({header: list(col) for header, col in zip(headers, columns)})
+    finally:
+        wb.close()  # release the underlying zip handle
+
 @st.cache_data(ttl=60)
 def load_data(file_mtime):
     # Use WORKING_DIR from secrets
@@ -55,20 +157,70 @@ def load_data(file_mtime):
         st.error(f"File at {excel_path} is not a valid Excel file.")
         return pd.DataFrame(), excel_path
 
+    # A Parquet sidecar keyed by the xlsx modification time lets every cold-cache
+    # load after the first skip the (slow) openpyxl parse entirely.
+    parquet_path = f"{excel_path}.{int(file_mtime)}.parquet"
+    if os.path.exists(parquet_path):
+        try:
+            df = pd.read_parquet(parquet_path, engine="pyarrow", memory_map=True)
+            if "Date" in df.columns and not df["Date"].is_monotonic_increasing:
+                df = df.sort_values("Date", ignore_index=True)
+            return _categorize_filter_columns(df), excel_path
+        except Exception:
+            pass  # corrupt/unreadable sidecar; fall through and rebuild it
+
     try:
-        df = pd.read_excel(excel_path)
+        df = _read_xlsx_stream(excel_path)
     except Exception as e:
         st.error(f"Error reading Excel file at {excel_path}: {e}. Make sure 'openpyxl' is installed.")
         return pd.DataFrame(), excel_path
 
     df["zip"] = df["zip"].astype(str)
 
+    # IncidentID is numeric in the source; store it as int64 so the many
+    # downstream unique/dedup passes hash native integers instead of Python
+    # objects. If non-numeric IDs ever appear, fall back to factorized codes
+    # (the dashboard only ever counts and deduplicates on this column).
+    if "IncidentID" in df.columns:
+        incident_num = pd.to_numeric(df["IncidentID"], errors="coerce")
+        if incident_num.notna().all():
+            df["IncidentID"] = incident_num.astype(np.int64)
+        else:
+            df["IncidentID"] = pd.factorize(df["IncidentID"])[0].astype(np.int64)
+
+    # float32 is plenty for lat/lon (~1 m precision at this latitude);
+    # halving the column width halves the bytes moved by the geo grouping
+    # and the map serialization. "N/A" placeholders become NaN.
+    for coord_col in ("lat", "lon"):
+        if coord_col in df.columns:
+            df[coord_col] = pd.to_numeric(df[coord_col], errors="coerce", downcast="float")
+
     if 'Date' in df.columns:
         df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
     else:
         st.error("The 'Date' column is missing from the data. Please check your data source.")
         return pd.DataFrame(), excel_path
 
+    df = _derive_calendar_columns(df)
+    df = _categorize_filter_columns(df)
+
+    # Keep the frame sorted by Date (NaT last). Row filtering preserves
+    # order, so date-range selection and the window metrics downstream can
+    # bisect the column instead of scanning it, and nothing has to re-sort.
+    df = df.sort_values("Date", ignore_index=True)
+
+    # Write the sidecar (dtypes included) and drop sidecars left over from
+    # previous versions of the xlsx.
+    try:
+        df.to_parquet(parquet_path, engine="pyarrow", compression="zstd")
+        data_dir = os.path.dirname(excel_path)
+        excel_name = os.path.basename(excel_path)
+        for name in os.listdir(data_dir):
+            if name.startswith(excel_name + ".") and name.endswith(".parquet") and name != os.path.basename(parquet_path):
+                os.remove(os.path.join(data_dir, name))
+    except Exception:
+        pass  # the sidecar is only a cache; keep serving the freshly read frame
+
     return df, excel_path
 
 # Determine the path and get its modification time
@@ -125,12 +277,23 @@ Caution should be used when making assumptions based solely on the data provided
 
 st.sidebar.title("Filters")
 
-def get_options(col, df):
+@st.cache_data(show_spinner=False)
+def get_options(col, fingerprint, _df):
     """
     Return sorted unique values (as strings) for the given column.
     This includes "N/A" values so that the default view includes all data.
+    Filter columns are Categoricals, so unique() scans their integer codes
+    rather than rebuilding a string array.
+
+    The DataFrame argument is underscore-prefixed so Streamlit does not hash
+    it; `fingerprint` (the file mtime plus the upstream neighborhood
+    selection) identifies the frame instead, so reruns where the upstream
+    filters did not change skip the scan and sort entirely.
     """
-    return sorted(df[col].astype(str).dropna().unique())
+    s = _df[col]
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return sorted(s.dropna().unique().tolist())
+    return sorted(s.astype(str).dropna().unique())
 
 with st.sidebar.expander("Color Palette", expanded=False):
     color_palettes = {
@@ -150,116 +313,195 @@ with st.sidebar.expander("Date Range", expanded=True):
     end_date = st.date_input("End Date", min_value=min_date, max_value=max_date, value=max_date)
 
 with st.sidebar.expander("Neighborhood", expanded=False):
-    neighborhood_options = get_options("neighborhood", df)
+    neighborhood_options = get_options("neighborhood", (file_mtime,), df)
     select_all_neighborhoods = st.checkbox("Select All Neighborhoods", value=True)
     if select_all_neighborhoods:
-        selected_neighborhood = st.multiselect("Select Neighborhood(s)", options=neighborhood_options, default=neighborhood_options)
+        # Skip the widget: the full option list never round-trips to the
+        # browser, and the filter is applied as a no-op downstream.
+        selected_neighborhood = neighborhood_options
     else:
-        selected_neighborhood = st.multiselect("Select Neighborhood(s)", options=neighborhood_options)
+        selected_neighborhood = st.multiselect("Select Neighborhood(s)", options=neighborhood_options, key="flt_neighborhood")
 
 # Filter the DataFrame based on the selected neighborhood(s)
-if selected_neighborhood:
-    filtered_df = df[df["neighborhood"].astype(str).isin(selected_neighborhood)]
-else:
+if select_all_neighborhoods or not selected_neighborhood:
     filtered_df = df
+else:
+    filtered_df = df[_isin_codes(df["neighborhood"], selected_neighborhood)]
+
+# Cache key for the cascaded option lists below: they only change when the
+# data file or the neighborhood selection does.
+options_fingerprint = (file_mtime, None if select_all_neighborhoods else tuple(selected_neighborhood))
 
 with st.sidebar.expander("Zip", expanded=False):
-    zip_options = get_options("zip", filtered_df)
+    zip_options = get_options("zip", options_fingerprint, filtered_df)
     select_all_zips = st.checkbox("Select All Zips", value=True)
     if select_all_zips:
-        selected_zip = st.multiselect("Select Zip(s)", options=zip_options, default=zip_options)
+        # Skip the widget: the full option list never round-trips to the
+        # browser, and the filter is applied as a no-op downstream.
+        selected_zip = zip_options
     else:
-        selected_zip = st.multiselect("Select Zip(s)", options=zip_options)
+        selected_zip = st.multiselect("Select Zip(s)", options=zip_options, key="flt_zip")
 
 with st.sidebar.expander("FullStreet", expanded=False):
-    fullstreet_options = get_options("FullStreet", filtered_df)
+    fullstreet_options = get_options("FullStreet", options_fingerprint, filtered_df)
     select_all_fullstreets = st.checkbox("Select All FullStreets", value=True)
     if select_all_fullstreets:
-        selected_fullstreet = st.multiselect("Select FullStreet(s)", options=fullstreet_options, default=fullstreet_options)
+        # Skip the widget: the full option list never round-trips to the
+        # browser, and the filter is applied as a no-op downstream.
+        selected_fullstreet = fullstreet_options
     else:
-        selected_fullstreet = st.multiselect("Select FullStreet(s)", options=fullstreet_options)
+        selected_fullstreet = st.multiselect("Select FullStreet(s)", options=fullstreet_options, key="flt_fullstreet")
 
 with st.sidebar.expander("Season", expanded=False):
-    season_options = get_options("Season", filtered_df)
+    season_options = get_options("Season", options_fingerprint, filtered_df)
     select_all_seasons = st.checkbox("Select All Seasons", value=True)
     if select_all_seasons:
-        selected_season = st.multiselect("Select Season(s)", options=season_options, default=season_options)
+        # Skip the widget: the full option list never round-trips to the
+        # browser, and the filter is applied as a no-op downstream.
+        selected_season = season_options
     else:
-        selected_season = st.multiselect("Select Season(s)", options=season_options)
+        selected_season = st.multiselect("Select Season(s)", options=season_options, key="flt_season")
 
 with st.sidebar.expander("Weekend", expanded=False):
     weekend_options = [True, False]
     select_all_weekends = st.checkbox("Select All Weekends", value=True)
     if select_all_weekends:
-        selected_weekend = st.multiselect("Select Weekend/Not Weekend", options=weekend_options, default=weekend_options)
+        # Skip the widget: the full option list never round-trips to the
+        # browser, and the filter is applied as a no-op downstream.
+        selected_weekend = weekend_options
     else:
-        selected_weekend = st.multiselect("Select Weekend/Not Weekend", options=weekend_options)
+        selected_weekend = st.multiselect("Select Weekend/Not Weekend", options=weekend_options, key="flt_weekend")
 
 with st.sidebar.expander("Day of Week", expanded=False):
-    dow_options = get_options("DayOfWeek", filtered_df)
+    dow_options = get_options("DayOfWeek", options_fingerprint, filtered_df)
     select_all_days = st.checkbox("Select All Days", value=True)
     if select_all_days:
-        selected_dayofweek = st.multiselect("Select Day(s)", options=dow_options, default=dow_options)
+        # Skip the widget: the full option list never round-trips to the
+        # browser, and the filter is applied as a no-op downstream.
+        selected_dayofweek = dow_options
     else:
-        selected_dayofweek = st.multiselect("Select Day(s)", options=dow_options)
+        selected_dayofweek = st.multiselect("Select Day(s)", options=dow_options, key="flt_dayofweek")
 
 with st.sidebar.expander("Time of Day", expanded=False):
-    tod_options = get_options("TimeOfDay", filtered_df)
+    tod_options = get_options("TimeOfDay", options_fingerprint, filtered_df)
     select_all_times = st.checkbox("Select All Times", value=True)
     if select_all_times:
-        selected_tod = st.multiselect("Select Time of Day", options=tod_options, default=tod_options)
+        # Skip the widget: the full option list never round-trips to the
+        # browser, and the filter is applied as a no-op downstream.
+        selected_tod = tod_options
     else:
-        selected_tod = st.multiselect("Select Time of Day", options=tod_options)
+        selected_tod = st.multiselect("Select Time of Day", options=tod_options, key="flt_timeofday")
 
 with st.sidebar.expander("Agency", expanded=False):
-    agency_options = get_options("Agency", filtered_df)
+    agency_options = get_options("Agency", options_fingerprint, filtered_df)
     select_all_agencies = st.checkbox("Select All Agencies", value=True)
     if select_all_agencies:
-        selected_agency = st.multiselect("Select Agency", options=agency_options, default=agency_options)
+        # Skip the widget: the full option list never round-trips to the
+        # browser, and the filter is applied as a no-op downstream.
+        selected_agency = agency_options
     else:
-        selected_agency = st.multiselect("Select Agency", options=agency_options)
+        selected_agency = st.multiselect("Select Agency", options=agency_options, key="flt_agency")
 
 with st.sidebar.expander("Offense", expanded=False):
-    offense_options = get_options("Offense", filtered_df)
+    offense_options = get_options("Offense", options_fingerprint, filtered_df)
     select_all_offenses = st.checkbox("Select All Offenses", value=True)
     if select_all_offenses:
-        selected_offense = st.multiselect("Select Offense(s)", options=offense_options, default=offense_options)
+        # Skip the widget: the full option list never round-trips to the
+        # browser, and the filter is applied as a no-op downstream.
+        selected_offense = offense_options
     else:
-        selected_offense = st.multiselect("Select Offense(s)", options=offense_options)
+        selected_offense = st.multiselect("Select Offense(s)", options=offense_options, key="flt_offense")
 
 with st.sidebar.expander("Reporting Officer", expanded=False):
-    reporting_options = get_options("ReportingOfficer", filtered_df)
+    reporting_options = get_options("ReportingOfficer", options_fingerprint, filtered_df)
     select_all_reporting = st.checkbox("Select All Reporting Officers", value=True)
     if select_all_reporting:
-        selected_reporting = st.multiselect("Select Reporting Officer(s)", options=reporting_options, default=reporting_options)
+        # Skip the widget: the full option list never round-trips to the
+        # browser, and the filter is applied as a no-op downstream.
+        selected_reporting = reporting_options
     else:
-        selected_reporting = st.multiselect("Select Reporting Officer(s)", options=reporting_options)
+        selected_reporting = st.multiselect("Select Reporting Officer(s)", options=reporting_options, key="flt_reporting")
 
 #######################################
 # Filter Data Based on Selections
 #######################################
 
-filtered_df = filtered_df[
-    (filtered_df["Date"].dt.date >= start_date) &
-    (filtered_df["Date"].dt.date <= end_date) &
-    (filtered_df["Offense"].isin(selected_offense)) &
-    (filtered_df["ReportingOfficer"].astype(str).isin(selected_reporting)) &
-    (filtered_df["Agency"].isin(selected_agency)) &
-    (filtered_df["TimeOfDay"].isin(selected_tod)) &
-    (filtered_df["DayOfWeek"].isin(selected_dayofweek)) &
-    (filtered_df["Weekend"].isin(selected_weekend)) &
-    (filtered_df["Season"].isin(selected_season)) &
-    (filtered_df["FullStreet"].isin(selected_fullstreet)) &
-    (filtered_df["zip"].isin(selected_zip)) &
-    (filtered_df["neighborhood"].astype(str).isin(selected_neighborhood))
-]
+@st.cache_data(show_spinner=False)
+def apply_filters(file_mtime, start_date, end_date, selections, weekend_selection):
+    """
+    Apply the sidebar filters to the loaded frame and return both the
+    filtered frame and its one-row-per-IncidentID view.
+
+    All predicates accumulate into one preallocated boolean mask instead of
+    materializing eleven separate arrays plus their pairwise ANDs. The date
+    range goes first since it is usually the most selective, and a selection
+    of None means "Select All", which is skipped outright - selecting every
+    option cannot exclude a row.
+
+    The frames are cached on the data file mtime plus the selection values
+    (frozensets, so the same selection hashes identically regardless of
+    click order); reruns that only touch widgets downstream of the filters
+    reuse the cached result.
+    """
+    df, _ = load_data(file_mtime)
+    # The frame is kept sorted by Date, so the date range is a contiguous
+    # slice found by bisection rather than two full-column compares.
+    lo, hi = np.searchsorted(
+        df["Date"].to_numpy(),
+        [np.datetime64(start_date), np.datetime64(end_date) + np.timedelta64(1, "D")],
+    )
+    mask = np.zeros(len(df), dtype=bool)
+    mask[lo:hi] = True
+    for filter_col, selected_values in selections:
+        if selected_values is None:
+            continue
+        np.logical_and(mask, _isin_codes(df[filter_col], selected_values).to_numpy(), out=mask)
+    if weekend_selection is not None:
+        np.logical_and(mask, df["Weekend"].isin(weekend_selection).to_numpy(), out=mask)
+    filtered = df[mask]
+    # IncidentID is unique per row in practice; dedupe once (a no-op in the
+    # common case) so every aggregation downstream can use plain
+    # value_counts/size instead of re-hashing IncidentID per panel.
+    if filtered["IncidentID"].is_unique:
+        return filtered, filtered
+    return filtered, filtered.drop_duplicates("IncidentID")
+
+selections = tuple(
+    (filter_col, None if select_all else frozenset(selected_values))
+    for selected_values, select_all, filter_col in (
+        (selected_offense, select_all_offenses, "Offense"),
+        (selected_reporting, select_all_reporting, "ReportingOfficer"),
+        (selected_agency, select_all_agencies, "Agency"),
+        (selected_tod, select_all_times, "TimeOfDay"),
+        (selected_dayofweek, select_all_days, "DayOfWeek"),
+        (selected_season, select_all_seasons, "Season"),
+        (selected_fullstreet, select_all_fullstreets, "FullStreet"),
+        (selected_zip, select_all_zips, "zip"),
+        (selected_neighborhood, select_all_neighborhoods, "neighborhood"),
+    )
+)
+weekend_selection = None if select_all_weekends else frozenset(selected_weekend)
+filtered_df, unique_df = apply_filters(file_mtime, start_date, end_date, selections, weekend_selection)
+
+# One hashable token for the current filter state, for caches keyed on it.
+filter_key = (file_mtime, start_date, end_date, selections, weekend_selection)
+
+# Every categorical breakdown below reads from this dict, so the deduped
+# frame is scanned once per dimension here and never again per chart. The
+# scans are independent and pandas releases the GIL inside the C-level
+# counting, so run them on a small thread pool instead of sequentially.
+DIM_COLS = ("Season", "Weekend", "DayOfWeek", "TimeOfDay", "Offense",
+            "ReportingOfficer", "zip", "neighborhood", "FullStreet")
+with ThreadPoolExecutor(max_workers=4) as executor:
+    dim_futures = {col: executor.submit(_unique_counts, unique_df, col) for col in DIM_COLS}
+    dim_counts = {col: future.result() for col, future in dim_futures.items()}
 
 #######################################
 # Metrics Section (New Layout: 6 Metrics per Row)
 #######################################
 
 # Calculate the total number of incidents for percentage calculation
-total_incidents = filtered_df["IncidentID"].nunique()
+total_incidents = filtered_df["IncidentID"].unique().shape[0]
 
 st.header("Metrics")
 
@@ -267,51 +509,97 @@ current_date = pd.to_datetime("today").normalize()
 current_year = current_date.year
 current_month = current_date.month
 
-# Existing metrics calculations
-incidents_last7days = filtered_df[filtered_df["Date"].dt.date >= (current_date - pd.Timedelta(days=7)).date()]["IncidentID"].nunique()
-df_this_year = filtered_df[filtered_df["Date"].dt.year == current_year]
-df_this_month = df_this_year[df_this_year["Date"].dt.month == current_month]
-incidents_last_month = df_this_year[
-    (df_this_year["Date"] >= (current_date.replace(day=1) - pd.Timedelta(days=1)).replace(day=1)) &
-    (df_this_year["Date"] < current_date.replace(day=1))
-]["IncidentID"].nunique()
-incidents_this_month = df_this_month["IncidentID"].nunique()
-incidents_this_year = df_this_year["IncidentID"].nunique()
-
-# Update deprecated frequency string 'M' to 'ME'
-monthly_counts = df_this_year.groupby(pd.Grouper(key="Date", freq="ME"))["IncidentID"].nunique()
-if len(monthly_counts) >= 2 and monthly_counts.iloc[-2] != 0:
-    mom_growth = ((monthly_counts.iloc[-1] - monthly_counts.iloc[-2]) / monthly_counts.iloc[-2]) * 100
+# The loaded frame is sorted by Date and filtering preserves that order, so
+# the deduplicated Date array is already sorted. With one row per
+# IncidentID, every date-window metric below collapses to a pair of binary
+# searches and an index subtraction - no per-window hashing or scans at all.
+metric_dates = unique_df["Date"].to_numpy(dtype="datetime64[ns]")
+
+# Every window is [start, end] in whole days, inclusive; an open end (None)
+# runs to the end of the data. Since they all bisect the same array, their
+# bounds are collected up front and resolved with a single vectorized
+# searchsorted - the all-buckets-in-one-pass formulation, minus any hashing.
+this_month_start = current_date.replace(day=1).date()
+prev_month_start = (current_date.replace(day=1) - pd.Timedelta(days=1)).replace(day=1).date()
+start_ytd = datetime.date(current_year, 1, 1)
+end_ytd = current_date.date()
+last_week_start = (current_date - pd.Timedelta(days=7)).date()
+last_week_end = (current_date - pd.Timedelta(days=1)).date()
+previous_week_start = (current_date - pd.Timedelta(days=14)).date()
+previous_week_end = (current_date - pd.Timedelta(days=8)).date()
+current_quarter = ((current_month - 1) // 3) + 1
+quarter_start = datetime.date(current_year, (current_quarter - 1) * 3 + 1, 1)
+if current_quarter == 1:
+    quarter_start_prev = datetime.date(current_year - 1, 10, 1)
+    quarter_end_prev = datetime.date(current_year - 1, 12, 31)
+else:
+    prev_quarter = current_quarter - 1
+    quarter_start_prev = datetime.date(current_year, (prev_quarter - 1) * 3 + 1, 1)
+    quarter_end_prev = datetime.date(current_year, prev_quarter * 3 + 1, 1) - datetime.timedelta(days=1)
+six_months_ago = current_date - pd.DateOffset(months=6)
+
+metric_windows = {
+    "last7days": (last_week_start, None),
+    "last3days": ((current_date - pd.Timedelta(days=3)).date(), None),
+    "last2weeks": (previous_week_start, None),
+    "last_6_months": (six_months_ago.date(), None),
+    "last_month": (prev_month_start, this_month_start - datetime.timedelta(days=1)),
+    "this_month": (this_month_start, None),
+    "this_year": (start_ytd, None),
+    "ytd": (start_ytd, end_ytd),
+    "last_week": (last_week_start, last_week_end),
+    "previous_week": (previous_week_start, previous_week_end),
+    "this_quarter": (quarter_start, end_ytd),
+    "previous_quarter": (quarter_start_prev, quarter_end_prev),
+}
+window_bounds = np.empty(2 * len(metric_windows), dtype="datetime64[ns]")
+for i, (start, end) in enumerate(metric_windows.values()):
+    window_bounds[2 * i] = np.datetime64(start, "D")
+    if end is None:
+        window_bounds[2 * i + 1] = np.datetime64(pd.Timestamp.max)
+    else:
+        window_bounds[2 * i + 1] = np.datetime64(end, "D") + np.timedelta64(1, "D")
+window_idx = np.searchsorted(metric_dates, window_bounds)
+window_counts = {
+    name: int(window_idx[2 * i + 1] - window_idx[2 * i])
+    for i, name in enumerate(metric_windows)
+}
+
+incidents_last7days = window_counts["last7days"]
+incidents_last_month = window_counts["last_month"]
+incidents_this_month = window_counts["this_month"]
+incidents_this_year = window_counts["this_year"]
+
+# Month over Month Growth: current month versus the previous month.
+if incidents_last_month != 0:
+    mom_growth = ((incidents_this_month - incidents_last_month) / incidents_last_month) * 100
     mom_growth_str = f"{mom_growth:.1f}%"
 else:
     mom_growth_str = "N/A"
 
-start_ytd = datetime.date(current_year, 1, 1)
-end_ytd = current_date.date()
-current_ytd = df_this_year[(df_this_year["Date"].dt.date >= start_ytd) & (df_this_year["Date"].dt.date <= end_ytd)]["IncidentID"].nunique()
+current_ytd = window_counts["ytd"]
 
 start_last_year = datetime.date(current_year - 1, 1, 1)
 end_last_year = datetime.date(current_year - 1, current_date.month, current_date.day)
-last_year_data = df[df["Date"].dt.year == current_year - 1]
-last_year_ytd = last_year_data[(last_year_data["Date"].dt.date >= start_last_year) & (last_year_data["Date"].dt.date <= end_last_year)]["IncidentID"].nunique()
+# Last-year YTD is measured against the full (unfiltered) frame, matching
+# the YoY definition below. The loaded frame is sorted by Date, so the
+# window is a bisected slice rather than a full-column boolean mask.
+all_dates = df["Date"].to_numpy()
+ly_lo = np.searchsorted(all_dates, np.datetime64(start_last_year))
+ly_hi = np.searchsorted(all_dates, np.datetime64(end_last_year) + np.timedelta64(1, "D"))
+last_year_ytd = pd.unique(df["IncidentID"].to_numpy()[ly_lo:ly_hi]).shape[0]
 if last_year_ytd != 0:
     yoy_growth = ((current_ytd - last_year_ytd) / last_year_ytd) * 100
     yoy_growth_str = f"{yoy_growth:.1f}%"
 else:
     yoy_growth_str = "N/A"
 
-# New metrics for the first row
-incidents_last3days = filtered_df[filtered_df["Date"].dt.date >= (current_date - pd.Timedelta(days=3)).date()]["IncidentID"].nunique()
-incidents_last2weeks = filtered_df[filtered_df["Date"].dt.date >= (current_date - pd.Timedelta(days=14)).date()]["IncidentID"].nunique()
+incidents_last3days = window_counts["last3days"]
+incidents_last2weeks = window_counts["last2weeks"]
 
-# New metrics for the second row: Week over week growth and Quarter over quarter growth.
 # Week over Week Growth:
-last_week_start = (current_date - pd.Timedelta(days=7)).date()
-last_week_end = (current_date - pd.Timedelta(days=1)).date()
-previous_week_start = (current_date - pd.Timedelta(days=14)).date()
-previous_week_end = (current_date - pd.Timedelta(days=8)).date()
-last_week_count = filtered_df[(filtered_df["Date"].dt.date >= last_week_start) & (filtered_df["Date"].dt.date <= last_week_end)]["IncidentID"].nunique()
-previous_week_count = filtered_df[(filtered_df["Date"].dt.date >= previous_week_start) & (filtered_df["Date"].dt.date <= previous_week_end)]["IncidentID"].nunique()
+last_week_count = window_counts["last_week"]
+previous_week_count = window_counts["previous_week"]
 if previous_week_count != 0:
     wow_growth = ((last_week_count - previous_week_count) / previous_week_count) * 100
     wow_growth_str = f"{wow_growth:.1f}%"
@@ -319,54 +607,36 @@ else:
     wow_growth_str = "N/A"
 
 # Quarter over Quarter Growth:
-current_quarter = ((current_month - 1) // 3) + 1
-quarter_start = datetime.date(current_year, (current_quarter - 1) * 3 + 1, 1)
-current_quarter_count = filtered_df[(filtered_df["Date"].dt.date >= quarter_start) & (filtered_df["Date"].dt.date <= current_date.date())]["IncidentID"].nunique()
-
-if current_quarter == 1:
-    prev_year = current_year - 1
-    prev_quarter = 4
-    quarter_start_prev = datetime.date(prev_year, 10, 1)
-    quarter_end_prev = datetime.date(prev_year, 12, 31)
-else:
-    prev_quarter = current_quarter - 1
-    quarter_start_prev = datetime.date(current_year, (prev_quarter - 1) * 3 + 1, 1)
-    quarter_end_prev = (datetime.date(current_year, prev_quarter * 3 + 1, 1) - datetime.timedelta(days=1))
-
-previous_quarter_count = filtered_df[(filtered_df["Date"].dt.date >= quarter_start_prev) & (filtered_df["Date"].dt.date <= quarter_end_prev)]["IncidentID"].nunique()
+current_quarter_count = window_counts["this_quarter"]
+previous_quarter_count = window_counts["previous_quarter"]
 if previous_quarter_count != 0:
     qoq_growth = ((current_quarter_count - previous_quarter_count) / previous_quarter_count) * 100
     qoq_growth_str = f"{qoq_growth:.1f}%"
 else:
     qoq_growth_str = "N/A"
 
-# Calculate Most Frequent Offense.
-offense_counts = (
-    filtered_df.groupby("Offense")["IncidentID"]
-    .nunique()
-    .reset_index(name="Count")
-    .sort_values("Count", ascending=False)
-)
-if not offense_counts.empty:
-    most_freq_offense = offense_counts.iloc[0]["Offense"]
-    most_freq_count = offense_counts.iloc[0]["Count"]
-    total_offense_counts = offense_counts["Count"].sum()
-    offense_percent = (most_freq_count / total_offense_counts) * 100
+# Calculate Most Frequent Offense. The per-offense unique-incident counts
+# already exist (sorted descending) in dim_counts, so the winner is row 0;
+# read it and the denominator straight off the ndarray rather than through
+# a reset_index frame and positional lookups.
+offense_counts = dim_counts["Offense"].rename_axis("Offense").reset_index(name="Count")
+offense_count_values = dim_counts["Offense"].to_numpy()
+if offense_count_values.shape[0]:
+    most_freq_offense = dim_counts["Offense"].index[0]
+    most_freq_count = int(offense_count_values[0])
+    offense_percent = (most_freq_count / offense_count_values.sum()) * 100
     offense_percent_str = f"{offense_percent:.1f}%"
 else:
     most_freq_offense = "N/A"
     most_freq_count = 0
     offense_percent_str = "N/A"
 
-# Calculate additional metrics
-six_months_ago = current_date - pd.DateOffset(months=6)
-incidents_last_6_months = filtered_df[filtered_df["Date"] >= six_months_ago]["IncidentID"].nunique()
+incidents_last_6_months = window_counts["last_6_months"]
 
-current_quarter = ((current_month - 1) // 3) + 1
-quarter_start = datetime.date(current_year, (current_quarter - 1) * 3 + 1, 1)
-incidents_this_quarter = filtered_df[(filtered_df["Date"].dt.date >= quarter_start) & (filtered_df["Date"].dt.date <= current_date.date())]["IncidentID"].nunique()
+# Same window as the QoQ numerator above, so reuse it.
+incidents_this_quarter = current_quarter_count
 
-daily_counts = filtered_df.groupby(filtered_df["Date"].dt.date)["IncidentID"].nunique()
+daily_counts = unique_df["Date"].dt.floor("D").value_counts()
 avg_crimes_per_day = daily_counts.mean()
 median_crimes_per_day = daily_counts.median()
 
@@ -408,35 +678,47 @@ st.subheader("Incidents Over Time")
 # Set default resolution to "Monthly"
 resolution = st.selectbox("Select Resolution", ["Daily", "Weekly", "Monthly", "Quarterly", "Yearly"], index=2)
 
+RESAMPLE_FREQ = {"Weekly": "W", "Monthly": "ME", "Quarterly": "QE", "Yearly": "YE"}
+
+def bin_incidents_by_period(dates, freq):
+    """
+    Count unique incidents per period by bisecting the pre-sorted Date array
+    against the period start boundaries - one searchsorted over a handful of
+    boundaries (days to years) instead of a pandas resample over every row.
+    Labels are the period ends, matching what pd.Grouper used to emit.
+    """
+    if len(dates) == 0:
+        return pd.DataFrame({"Date": pd.to_datetime([]), "Count": []})
+    periods = pd.period_range(pd.Timestamp(dates[0]), pd.Timestamp(dates[-1]), freq=freq)
+    bucket_edges = np.searchsorted(dates, periods.start_time.to_numpy())
+    counts = np.diff(np.append(bucket_edges, len(dates)))
+    labels = periods.start_time if freq == "D" else periods.end_time.normalize()
+    time_series = pd.DataFrame({"Date": labels, "Count": counts})
+    if freq == "D":
+        # The old groupby(dt.date) never emitted empty days; keep that, so
+        # the percentile lines are computed over the same set of bars.
+        time_series = time_series[time_series["Count"] > 0].reset_index(drop=True)
+    return time_series
+
+@st.cache_data(show_spinner=False)
+def daily_incident_counts(filter_key, _dates):
+    """
+    Daily unique-incident series for the current filter state, cached so a
+    resolution switch does not re-bin the full Date array.
+    """
+    return bin_incidents_by_period(_dates, "D")
+
+# Every coarser resolution is a resample of the (small) daily series, so
+# switching resolutions only ever touches a few hundred rows.
+daily_series = daily_incident_counts(filter_key, metric_dates)
 if resolution == "Daily":
+    time_series = daily_series
+else:
     time_series = (
-        filtered_df.groupby(filtered_df["Date"].dt.date)["IncidentID"]
-        .nunique()
-        .reset_index(name="Count")
-    )
-elif resolution == "Weekly":
-    time_series = (
-        filtered_df.groupby(pd.Grouper(key="Date", freq="W"))["IncidentID"]
-        .nunique()
-        .reset_index(name="Count")
-    )
-elif resolution == "Monthly":
-    time_series = (
-        filtered_df.groupby(pd.Grouper(key="Date", freq="ME"))["IncidentID"]
-        .nunique()
-        .reset_index(name="Count")
-    )
-elif resolution == "Quarterly":
-    time_series = (
-        filtered_df.groupby(pd.Grouper(key="Date", freq="Q"))["IncidentID"]
-        .nunique()
-        .reset_index(name="Count")
-    )
-elif resolution == "Yearly":
-    time_series = (
-        filtered_df.groupby(pd.Grouper(key="Date", freq="Y"))["IncidentID"]
-        .nunique()
-        .reset_index(name="Count")
+        daily_series.set_index("Date")["Count"]
+        .resample(RESAMPLE_FREQ[resolution])
+        .sum()
+        .reset_index()
     )
 
 # Calculate percentiles for the selected resolution
@@ -513,45 +795,40 @@ st.plotly_chart(fig_time_series, use_container_width=True)
 st.subheader("Top 5 Offenses Over Time")
 
 # Get the top 5 offenses based on the filtered data
-top_5_offenses = (
-    filtered_df.groupby("Offense")["IncidentID"]
-    .nunique()
-    .nlargest(5)
-    .index
-)
+top_5_offenses = dim_counts["Offense"].head(5).index
 
 # Filter the data to include only the top 5 offenses
-filtered_top_offenses = filtered_df[filtered_df["Offense"].isin(top_5_offenses)]
+filtered_top_offenses = unique_df[unique_df["Offense"].isin(top_5_offenses)]
 
 # Group data by offense and the selected resolution
 if resolution == "Daily":
     offenses_time_series = (
-        filtered_top_offenses.groupby([filtered_top_offenses["Date"].dt.date, "Offense"])["IncidentID"]
-        .nunique()
+        filtered_top_offenses.groupby([filtered_top_offenses["Date"].dt.date, "Offense"], observed=True)
+        .size()
         .reset_index(name="Count")
     )
 elif resolution == "Weekly":
     offenses_time_series = (
-        filtered_top_offenses.groupby([pd.Grouper(key="Date", freq="W"), "Offense"])["IncidentID"]
-        .nunique()
+        filtered_top_offenses.groupby([pd.Grouper(key="Date", freq="W"), "Offense"], observed=True)
+        .size()
         .reset_index(name="Count")
     )
 elif resolution == "Monthly":
     offenses_time_series = (
-        filtered_top_offenses.groupby([pd.Grouper(key="Date", freq="ME"), "Offense"])["IncidentID"]
-        .nunique()
+        filtered_top_offenses.groupby([pd.Grouper(key="Date", freq="ME"), "Offense"], observed=True)
+        .size()
         .reset_index(name="Count")
     )
 elif resolution == "Quarterly":
     offenses_time_series = (
-        filtered_top_offenses.groupby([pd.Grouper(key="Date", freq="Q"), "Offense"])["IncidentID"]
-        .nunique()
+        filtered_top_offenses.groupby([pd.Grouper(key="Date", freq="Q"), "Offense"], observed=True)
+        .size()
         .reset_index(name="Count")
     )
 elif resolution == "Yearly":
     offenses_time_series = (
-        filtered_top_offenses.groupby([pd.Grouper(key="Date", freq="Y"), "Offense"])["IncidentID"]
-        .nunique()
+        filtered_top_offenses.groupby([pd.Grouper(key="Date", freq="Y"), "Offense"], observed=True)
+        .size()
         .reset_index(name="Count")
     )
 
@@ -577,40 +854,99 @@ st.subheader("Geographic Visualization")
 # Add a note about zoom functionality
 st.markdown("**Note:** Use the zoom controls at the top right corner of the map or the scroll on your mouse to zoom in and out.")
 
-# Create a column to represent the intensity of incidents per location
-filtered_df["IncidentCount"] = filtered_df.groupby(["lat", "lon"])["IncidentID"].transform("count")
-
-# Use density_map for geographic visualization
-fig_geo = px.density_map(
-    filtered_df,
-    lat="lat",
-    lon="lon",
-    z="IncidentCount",  # use the new column for intensity
-    radius=10,
-    center=dict(lat=38.0293, lon=-78.4767),  # approximate center of Charlottesville
-    zoom=12.6,
-    map_style="open-street-map",  # Corrected argument
-    title="Incident Frequency by Geography"
-)
-fig_geo.update_layout(
-    height=1200,
-    width=1200
-)
+# Cap on grid cells shipped to the browser. Past this the fine grid is
+# re-binned at ~500 m so the trace payload stays bounded as the data grows.
+MAX_MAP_CELLS = 15000
 
-# Calculate the total number of incidents for percentage calculation
-total_incidents_geo = filtered_df["IncidentID"].nunique()
-
-# Update hover template to show neighborhood, zip code, and percentage of total incidents
-fig_geo.update_traces(
-    hovertemplate="<b>Location:</b> %{lat}, %{lon}<br>" +
-                  "<b>Neighborhood:</b> %{customdata[0]}<br>" +
-                  "<b>Zip Code:</b> %{customdata[1]}<br>" +
-                  "<b>Incident Count:</b> %{z}<br>" +
-                  "<b>Percent of Total Incidents:</b> %{customdata[2]:.1%}<extra></extra>",
-    customdata=filtered_df[["neighborhood", "zip", "IncidentCount"]].apply(lambda row: (row["neighborhood"], row["zip"], row["IncidentCount"] / total_incidents_geo), axis=1)
+def _grid_cells(lat, lon, scale):
+    """
+    Snap coordinates to a 1/scale-degree grid, pack each pair into one int64
+    key, and return the index of a representative row plus the count for
+    every occupied cell.
+    """
+    lat_key = np.round(lat * scale).astype(np.int64)
+    lon_key = np.round(lon * scale).astype(np.int64)
+    geo_key = (lat_key << 32) | (lon_key & np.int64(0xFFFFFFFF))
+    _, first, counts = np.unique(geo_key, return_index=True, return_counts=True)
+    return first, counts
+
+# Pre-aggregate to one row per location instead of broadcasting a count
+# back across every incident row. The 1e-4 degree grid (~10 m) keeps exact
+# locations; if the filter spans enough distinct addresses to blow past
+# MAX_MAP_CELLS, fall back to a 5e-3 degree grid (~500 m) so Plotly always
+# receives a bounded number of weighted points rather than every incident.
+geo_lat = unique_df["lat"].to_numpy()
+geo_lon = unique_df["lon"].to_numpy()
+geo_valid = np.flatnonzero(~(np.isnan(geo_lat) | np.isnan(geo_lon)))
+geo_first, geo_counts = _grid_cells(geo_lat[geo_valid], geo_lon[geo_valid], 1e4)
+if geo_first.shape[0] > MAX_MAP_CELLS:
+    geo_first, geo_counts = _grid_cells(geo_lat[geo_valid], geo_lon[geo_valid], 200)
+geo_df = unique_df.iloc[geo_valid[geo_first]][["lat", "lon", "neighborhood", "zip"]].copy()
+# counts fit comfortably in int32; half the bytes through the figure
+geo_df["IncidentCount"] = geo_counts.astype(np.int32)
+
+# Built once at import; the per-render concatenation allocated a fresh
+# template string each time the figure was constructed.
+GEO_HOVER_TMPL = (
+    "<b>Location:</b> %{lat}, %{lon}<br>"
+    "<b>Neighborhood:</b> %{customdata[0]}<br>"
+    "<b>Zip Code:</b> %{customdata[1]}<br>"
+    "<b>Incident Count:</b> %{z}<br>"
+    "<b>Percent of Total Incidents:</b> %{customdata[2]:.1%}<extra></extra>"
 )
 
-st.plotly_chart(fig_geo, use_container_width=True, config={"scrollZoom": True})
+@st.cache_resource(show_spinner=False)
+def build_geo_fig(filter_key, _geo_df, total_incidents):
+    """
+    Build the density-map figure for the current filter state. The figure
+    never changes between filter changes, so cache the constructed object
+    itself and skip the Plotly build entirely on unrelated reruns.
+    """
+    # Hand the constructor bare ndarray views of the three numeric columns
+    # rather than the DataFrame: plotly express then skips its per-column
+    # pandas extraction and serializes the arrays as-is.
+    fig_geo = px.density_map(
+        lat=_geo_df["lat"].to_numpy(),
+        lon=_geo_df["lon"].to_numpy(),
+        z=_geo_df["IncidentCount"].to_numpy(),  # per-cell intensity
+        radius=10,
+        center=dict(lat=38.0293, lon=-78.4767),  # approximate center of Charlottesville
+        zoom=12.6,
+        map_style="open-street-map",  # Corrected argument
+        title="Incident Frequency by Geography"
+    )
+    fig_geo.update_layout(
+        height=1200,
+        width=1200
+    )
+
+    # Update hover template to show neighborhood, zip code, and percentage of
+    # total incidents. The customdata matrix is built with one vectorized
+    # divide and a column stack rather than a Python-level apply allocating a
+    # tuple per row.
+    # One float32 divide: half the bytes of float64 in the customdata and
+    # its JSON serialization, at far more precision than the 0.1% display.
+    geo_pct = np.true_divide(_geo_df["IncidentCount"].to_numpy(),
+                             total_incidents, dtype=np.float32)
+    # neighborhood/zip are Categoricals; gather through the (small) category
+    # arrays so each distinct string exists once and repeats are references,
+    # instead of materializing a fresh object array of per-row strings. The
+    # gathers land straight in a preallocated output matrix, skipping the
+    # extra copy a column_stack would make.
+    nb = _geo_df["neighborhood"].cat
+    zp = _geo_df["zip"].cat
+    geo_customdata = np.empty((len(_geo_df), 3), dtype=object)
+    geo_customdata[:, 0] = nb.categories.to_numpy()[nb.codes]
+    geo_customdata[:, 1] = zp.categories.to_numpy()[zp.codes]
+    geo_customdata[:, 2] = geo_pct
+    fig_geo.update_traces(
+        hovertemplate=GEO_HOVER_TMPL,
+        customdata=geo_customdata
+    )
+    return fig_geo
+
+st.plotly_chart(build_geo_fig(filter_key, geo_df, total_incidents),
+                use_container_width=True, config={"scrollZoom": True})
 
 #######################################
 # Detailed Visualizations (Side by Side)
@@ -619,102 +955,57 @@ st.plotly_chart(fig_geo, use_container_width=True, config={"scrollZoom": True})
 st.subheader("Detailed Visualizations")
 palette = color_palettes[selected_palette]
 
-# Row 1: By Season, By Weekend, By Day of Week, By Time of Day
-col1, col2, col3, col4 = st.columns(4)
+# Row 1: By Season, By Weekend, By Day of Week, By Time of Day - one
+# make_subplots figure, so Streamlit serializes and the browser lays out a
+# single figure instead of four.
 
 # By Season – order seasons in natural order.
 season_order = ["Winter", "Spring", "Summer", "Autumn"]
-freq_season = (
-    filtered_df.groupby("Season")["IncidentID"]
-    .nunique()
-    .reset_index(name="Frequency")
-)
+freq_season = dim_counts["Season"].rename_axis("Season").reset_index(name="Frequency")
 freq_season["PercentTotal"] = (freq_season["Frequency"] / total_incidents) * 100
-fig_season = px.bar(
-    freq_season, 
-    x="Season", 
-    y="PercentTotal", 
-    title="By Season",
-    color_discrete_sequence=palette, 
-    text_auto=True,
-    category_orders={"Season": season_order}
-)
-fig_season.update_traces(
-    texttemplate='%{y:.1f}%',
-    hovertemplate="<b>Season:</b> %{x}<br><b>Percent of Total:</b> %{y:.1f}%<extra></extra>"
-)
-col1.plotly_chart(fig_season, use_container_width=True)
+freq_season["Season"] = pd.Categorical(freq_season["Season"], categories=season_order, ordered=True)
+freq_season = freq_season.sort_values("Season")
 
 # By Weekend
-freq_weekend = (
-    filtered_df.groupby("Weekend")["IncidentID"]
-    .nunique()
-    .reset_index(name="Frequency")
-)
+freq_weekend = dim_counts["Weekend"].rename_axis("Weekend").reset_index(name="Frequency")
 freq_weekend["PercentTotal"] = (freq_weekend["Frequency"] / total_incidents) * 100
-fig_weekend = px.bar(
-    freq_weekend, 
-    x="Weekend", 
-    y="PercentTotal", 
-    title="By Weekend",
-    color_discrete_sequence=palette, 
-    text_auto=True
-)
-fig_weekend.update_traces(
-    texttemplate='%{y:.1f}%',
-    hovertemplate="<b>Weekend:</b> %{x}<br><b>Percent of Total:</b> %{y:.1f}%<extra></extra>"
-)
-col2.plotly_chart(fig_weekend, use_container_width=True)
 
 # By Day of Week – order starting with Sunday.
 weekday_order = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-freq_day = (
-    filtered_df.groupby("DayOfWeek")["IncidentID"]
-    .nunique()
-    .reset_index(name="Frequency")
-)
+freq_day = dim_counts["DayOfWeek"].rename_axis("DayOfWeek").reset_index(name="Frequency")
 freq_day["PercentTotal"] = (freq_day["Frequency"] / total_incidents) * 100
 freq_day["DayOfWeek"] = pd.Categorical(freq_day["DayOfWeek"], categories=weekday_order, ordered=True)
 freq_day = freq_day.sort_values("DayOfWeek")
-fig_day = px.bar(
-    freq_day, 
-    x="DayOfWeek", 
-    y="PercentTotal", 
-    title="By Day of Week",
-    color_discrete_sequence=palette, 
-    text_auto=True,
-    category_orders={"DayOfWeek": weekday_order}
-)
-fig_day.update_traces(
-    texttemplate='%{y:.1f}%',
-    hovertemplate="<b>Day of Week:</b> %{x}<br><b>Percent of Total:</b> %{y:.1f}%<extra></extra>"
-)
-col3.plotly_chart(fig_day, use_container_width=True)
 
 # By Time of Day – order by the natural occurrence.
 time_order = ["Early Morning", "Morning", "Afternoon", "Evening", "Night"]
-freq_tod = (
-    filtered_df.groupby("TimeOfDay")["IncidentID"]
-    .nunique()
-    .reset_index(name="Frequency")
-)
+freq_tod = dim_counts["TimeOfDay"].rename_axis("TimeOfDay").reset_index(name="Frequency")
 freq_tod["PercentTotal"] = (freq_tod["Frequency"] / total_incidents) * 100
 freq_tod["TimeOfDay"] = pd.Categorical(freq_tod["TimeOfDay"], categories=time_order, ordered=True)
 freq_tod = freq_tod.sort_values("TimeOfDay")
-fig_tod = px.bar(
-    freq_tod, 
-    x="TimeOfDay", 
-    y="PercentTotal", 
-    title="By Time of Day",
-    color_discrete_sequence=palette, 
-    text_auto=True,
-    category_orders={"TimeOfDay": time_order}
-)
-fig_tod.update_traces(
-    texttemplate='%{y:.1f}%',
-    hovertemplate="<b>Time of Day:</b> %{x}<br><b>Percent of Total:</b> %{y:.1f}%<extra></extra>"
+
+fig_detail = make_subplots(
+    rows=1, cols=4,
+    subplot_titles=("By Season", "By Weekend", "By Day of Week", "By Time of Day")
 )
-col4.plotly_chart(fig_tod, use_container_width=True)
+for panel, (freq_frame, x_col, hover_label) in enumerate((
+    (freq_season, "Season", "Season"),
+    (freq_weekend, "Weekend", "Weekend"),
+    (freq_day, "DayOfWeek", "Day of Week"),
+    (freq_tod, "TimeOfDay", "Time of Day"),
+), start=1):
+    fig_detail.add_trace(
+        go.Bar(
+            x=freq_frame[x_col].astype(str),
+            y=freq_frame["PercentTotal"],
+            texttemplate='%{y:.1f}%',
+            hovertemplate=f"<b>{hover_label}:</b> %{{x}}<br><b>Percent of Total:</b> %{{y:.1f}}%<extra></extra>",
+            marker_color=palette[0],
+        ),
+        row=1, col=panel
+    )
+fig_detail.update_layout(showlegend=False)
+st.plotly_chart(fig_detail, use_container_width=True)
 
 #######################################
 # Offense Visualization (Top 20 Bar Chart)
@@ -722,8 +1013,9 @@ col4.plotly_chart(fig_tod, use_container_width=True)
 
 st.subheader("Top 20 Offenses")
 
-# Adjust layout to use more horizontal space
-top20_offenses = offense_counts.sort_values("Count", ascending=False).head(20)
+# offense_counts is already sorted by Count (it comes from value_counts),
+# so the top 20 is a plain slice.
+top20_offenses = offense_counts.head(20).copy()
 top20_offenses["PercentTotal"] = (top20_offenses["Count"] / total_incidents) * 100
 fig_top20_offenses = px.bar(
     top20_offenses, 
@@ -747,12 +1039,7 @@ st.plotly_chart(fig_top20_offenses, use_container_width=True)
 st.subheader("Reporting Officer Distribution")
 
 # Calculate the count and percentage for each reporting officer
-reporting_counts = (
-    filtered_df.groupby("ReportingOfficer")["IncidentID"]
-    .nunique()
-    .reset_index(name="Count")
-    .sort_values("Count", ascending=False)
-)
+reporting_counts = dim_counts["ReportingOfficer"].rename_axis("ReportingOfficer").reset_index(name="Count")
 reporting_counts["PercentTotal"] = (reporting_counts["Count"] / total_incidents) * 100
 
 # Create a bar chart for reporting officer distribution
@@ -777,98 +1064,75 @@ st.plotly_chart(fig_reporting_officer, use_container_width=True)
 
 st.subheader("Location Distributions")
 
-# Place Zip Distribution, Neighborhood Distribution, and FullStreet Distribution side by side
-col_zip, col_nb, col_fs = st.columns(3)
+# Zip, Neighborhood, and FullStreet distributions side by side as one
+# three-pie subplot figure - one serialization pass instead of three.
 
 # Zip Distribution (All)
-zip_counts = (
-    filtered_df.groupby("zip")["IncidentID"]
-    .nunique()
-    .reset_index(name="Count")
-)
-total_zip = zip_counts["Count"].sum()
+zip_counts = dim_counts["zip"].rename_axis("zip").reset_index(name="Count")
 zip_counts["PercentTotal"] = zip_counts["Count"] / total_incidents * 100
-fig_zip = px.pie(
-    zip_counts,
-    names="zip",
-    values="Count",
-    title="Zip Distribution (All)",
-    hole=0.3,
-    color_discrete_sequence=palette
-)
-fig_zip.update_traces(
-    text=[f"{pct:.1f}%" for pct in zip_counts["PercentTotal"]],
-    textinfo="text",
-    textposition="inside",
-    hovertemplate="<b>%{label}</b><br>Percentage: %{text}<extra></extra>"
-)
-fig_zip.update_layout(height=600, width=600)  # Set consistent size
-col_zip.plotly_chart(fig_zip, use_container_width=True)
 
 # Neighborhood Distribution (All)
-nb_counts = (
-    filtered_df.groupby("neighborhood")["IncidentID"]
-    .nunique()
-    .reset_index(name="Count")
-)
+nb_counts = dim_counts["neighborhood"].rename_axis("neighborhood").reset_index(name="Count")
 total_nb = nb_counts["Count"].sum()
 nb_counts["PercentTotal"] = nb_counts["Count"] / total_nb * 100
-fig_nb = px.pie(
-    nb_counts,
-    names="neighborhood",
-    values="Count",
-    title="Neighborhood Distribution (All)",
-    hole=0.3,
-    color_discrete_sequence=palette
-)
-fig_nb.update_traces(
-    text=[f"{pct:.1f}%" for pct in nb_counts["PercentTotal"]],
-    textinfo="text",
-    textposition="inside",
-    hovertemplate="<b>%{label}</b><br>Percentage: %{text}<extra></extra>"
-)
-fig_nb.update_layout(height=600, width=600)  # Set consistent size
-col_nb.plotly_chart(fig_nb, use_container_width=True)
 
 # FullStreet Distribution (Top 25)
-fs_counts = (
-    filtered_df.groupby("FullStreet")["IncidentID"]
-    .nunique()
-    .reset_index(name="Count")
-)
+fs_counts = dim_counts["FullStreet"].rename_axis("FullStreet").reset_index(name="Count")
 total_fs = fs_counts["Count"].sum()
 top25_fs = fs_counts.sort_values("Count", ascending=False).head(25)
 top25_fs["PercentTotal"] = top25_fs["Count"] / total_fs * 100
-fig_fs = px.pie(
-    top25_fs,
-    names="FullStreet",
-    values="Count",
-    title="FullStreet Distribution (Top 25)",
-    hole=0.3,
-    color_discrete_sequence=palette
-)
-fig_fs.update_traces(
-    text=[f"{pct:.1f}%" for pct in top25_fs["PercentTotal"]],
-    textinfo="text",
-    textposition="inside",
-    hovertemplate="<b>%{label}</b><br>Percentage: %{text}<extra></extra>"
+
+fig_location = make_subplots(
+    rows=1, cols=3,
+    specs=[[{"type": "pie"}] * 3],
+    subplot_titles=("Zip Distribution (All)", "Neighborhood Distribution (All)", "FullStreet Distribution (Top 25)")
 )
-fig_fs.update_layout(height=600, width=600)  # Set consistent size
-col_fs.plotly_chart(fig_fs, use_container_width=True)
+for panel, (pie_frame, names_col) in enumerate((
+    (zip_counts, "zip"),
+    (nb_counts, "neighborhood"),
+    (top25_fs, "FullStreet"),
+), start=1):
+    fig_location.add_trace(
+        go.Pie(
+            labels=pie_frame[names_col],
+            values=pie_frame["Count"],
+            hole=0.3,
+            text=[f"{pct:.1f}%" for pct in pie_frame["PercentTotal"]],
+            textinfo="text",
+            textposition="inside",
+            hovertemplate="<b>%{label}</b><br>Percentage: %{text}<extra></extra>",
+            marker=dict(colors=palette),
+        ),
+        row=1, col=panel
+    )
+fig_location.update_layout(height=600, showlegend=False)
+st.plotly_chart(fig_location, use_container_width=True)
 
 #######################################
 # Interactive Table of Recent Incidents
 #######################################
 
+@st.cache_data(show_spinner=False)
+def recent_incidents(filter_key, _df):
+    """
+    The 100 most recent rows for the current filter state, cached so an
+    unrelated widget interaction does not recompute the selection. nlargest
+    keeps a bounded 100-row selection instead of sorting the whole frame.
+    Returned as an Arrow table: st.dataframe ships Arrow IPC to the browser
+    anyway, so converting here skips a pandas->Arrow pass per rerun.
+    """
+    return pa.Table.from_pandas(_df.nlargest(100, "Date"), preserve_index=False)
+
 st.subheader("Recent 100 Incidents")
-st.dataframe(filtered_df.sort_values(by="Date", ascending=False).head(100), use_container_width=True)
+st.dataframe(recent_incidents(filter_key, filtered_df), use_container_width=True)
 
 #######################################
 # Data Dictionary & Metric Definitions
 #######################################
 
-st.subheader("Data Dictionary & Metric Definitions")
-st.markdown("""
+# Static page copy; built once at import instead of re-parsing the
+# literal inside the script body on every rerun.
+DATA_DICT_MD = """
 **Data Dictionary:**
 
 - **RecordID:** Unique record identifier.
@@ -904,7 +1168,10 @@ st.markdown("""
 - **25th Percentile (25th %):** The value below which 25% of the incident counts fall.
 - **Median:** The middle value of the incident counts (50th percentile). Denoting or relating to a value or quantity lying at the midpoint of a frequency distribution of observed values or quantities, such that there is an equal probability of falling above or below it.
 - **75th Percentile (75th %):** The value below which 75% of the incident counts fall.
-""")
+"""
+
+st.subheader("Data Dictionary & Metric Definitions")
+st.markdown(DATA_DICT_MD)
 
 # Display the message about using secrets from Streamlit Cloud
 #st.info("Using secrets from Streamlit Cloud")